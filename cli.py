@@ -1,15 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import os
 import signal
-import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-from core.config.run_config import RunConfig
-from core.runtime.pipeline_runner import PipelineRunner
-
 
 def _handle_sigint(signum, frame) -> None:
     print("\n[INTERRUPTED] NexusArbiter terminated by user (Ctrl+C).")
@@ -53,10 +48,18 @@ def main(argv: list[str] | None = None) -> int:
     # Register Ctrl+C handler as early as possible
     signal.signal(signal.SIGINT, _handle_sigint)
 
-    load_dotenv()
-
     args = _build_parser().parse_args(argv)
 
+    # Deferred so --help and argument errors exit before dotenv and the runtime are imported.
+    from core.config.run_config import RunConfig
+    from core.runtime.pipeline_runner import PipelineRunner
+
+    # Environments that inject variables directly (e.g. CI) can skip the .env lookup entirely.
+    if os.environ.get("NEXUSARBITER_SKIP_DOTENV", "").strip().lower() not in {"1", "true", "yes"}:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
     if args.command == "run":
         project_root = Path(args.project_root).resolve() if args.project_root else Path.cwd().resolve()
         config_path = Path(args.config).resolve()
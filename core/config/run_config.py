@@ -7,12 +7,33 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 
-@dataclass
+DEFAULT_LOG_IO_DIR = "logs/io"
+DEFAULT_REQUEST_FILE_PATTERN = "{run_name}__{attempt}__request.json"
+DEFAULT_RESPONSE_FILE_PATTERN = "{run_name}__{attempt}__response.json"
+
+
+# Fields that belong only to agent runs (LLM steps)
+AGENT_FIELDS = frozenset({
+    "profile_file",
+    "provider",
+    "context_file",
+    "task_description",
+    "target_file",
+    "allowed_actions",
+    "rerun_index",
+    "target_run",
+    "rerun_strategy",
+    "log_io",
+    "rerun_methods",
+})
+
+
+@dataclass(slots=True)
 class LogIOSettings:
     enabled: bool = False
-    log_dir: str = "logs/io"
-    request_file_pattern: str = "{run_name}__{attempt}__request.json"
-    response_file_pattern: str = "{run_name}__{attempt}__response.json"
+    log_dir: str = DEFAULT_LOG_IO_DIR
+    request_file_pattern: str = DEFAULT_REQUEST_FILE_PATTERN
+    response_file_pattern: str = DEFAULT_RESPONSE_FILE_PATTERN
 
     @staticmethod
     def from_dict(data: Optional[Dict[str, Any]]) -> "LogIOSettings":
@@ -21,17 +42,13 @@ class LogIOSettings:
 
         return LogIOSettings(
             enabled=bool(data.get("enabled", False)),
-            log_dir=str(data.get("log_dir", "logs/io")),
-            request_file_pattern=str(
-                data.get("request_file_pattern", "{run_name}__{attempt}__request.json")
-            ),
-            response_file_pattern=str(
-                data.get("response_file_pattern", "{run_name}__{attempt}__response.json")
-            ),
+            log_dir=str(data.get("log_dir", DEFAULT_LOG_IO_DIR)),
+            request_file_pattern=str(data.get("request_file_pattern", DEFAULT_REQUEST_FILE_PATTERN)),
+            response_file_pattern=str(data.get("response_file_pattern", DEFAULT_RESPONSE_FILE_PATTERN)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RunItem:
     name: str
     profile_file: Optional[str]
@@ -59,7 +76,7 @@ class RunItem:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IncludeRuns:
     include_runs: List[str]
 
@@ -67,7 +84,7 @@ class IncludeRuns:
 RunStep = Union[RunItem, IncludeRuns]
 
 
-@dataclass
+@dataclass(slots=True)
 class RunConfig:
     runs: List[RunStep] = field(default_factory=list)
     retry_policy: Optional[Dict[str, Any]] = None
@@ -93,21 +110,6 @@ class RunConfig:
 
         runs: List[RunStep] = []
 
-        # Fields that belong only to agent runs (LLM steps)
-        agent_fields = {
-            "profile_file",
-            "provider",
-            "context_file",
-            "task_description",
-            "target_file",
-            "allowed_actions",
-            "rerun_index",
-            "target_run",
-            "rerun_strategy",
-            "log_io",
-            "rerun_methods",
-        }
-
         for idx, obj in enumerate(runs_raw):
             if not isinstance(obj, dict):
                 raise ValueError(f"runs[{idx}] must be an object.")
@@ -119,9 +121,8 @@ class RunConfig:
                         f"runs[{idx}] must not specify both 'include_run' and 'include_runs'."
                     )
 
-                # forbid agent fields on include steps
-                forbidden = [k for k in agent_fields if k in obj and k not in ("name",)]
-                # (name is allowed for nicer logs)
+                # forbid agent fields on include steps (name is allowed for nicer logs)
+                forbidden = obj.keys() & AGENT_FIELDS
                 if forbidden:
                     raise ValueError(
                         f"runs[{idx}] include step must not include agent fields: {sorted(forbidden)}."
@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -8,13 +9,13 @@ class JsonFormatter(logging.Formatter):
     """Format log records as single-line JSON objects."""
 
     # keys from LogRecord we DON'T want to dump
-    _skip_keys = {
+    _skip_keys = frozenset({
         "name", "msg", "args", "levelname", "levelno",
         "pathname", "filename", "module", "exc_info",
         "exc_text", "stack_info", "lineno", "funcName",
         "created", "msecs", "relativeCreated", "thread",
         "threadName", "processName", "process", "asctime"
-    }
+    })
 
     def format(self, record: logging.LogRecord) -> str:
         log_record = {
@@ -25,9 +26,10 @@ class JsonFormatter(logging.Formatter):
         }
 
         # include any extra fields passed via logger.*(..., extra={...})
-        for key, value in record.__dict__.items():
-            if key not in self._skip_keys:
-                log_record[key] = value
+        skip_keys = self._skip_keys
+        log_record.update(
+            (key, value) for key, value in record.__dict__.items() if key not in skip_keys
+        )
 
         return json.dumps(log_record, ensure_ascii=False)
 
@@ -77,3 +79,9 @@ class BasicLogger:
 
     def get_logger(self) -> logging.Logger:
         return self.logger
+
+
+@lru_cache(maxsize=None)
+def get_logger(name: str) -> logging.Logger:
+    """Return the logger for name with BasicLogger's default setup, configuring it only once."""
+    return BasicLogger(name).get_logger()
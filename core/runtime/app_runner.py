@@ -1,20 +1,43 @@
 # core/runtime/app_runner.py
 from __future__ import annotations
 
+import importlib
 import inspect
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import core.runtime.response_validation as rv
 from core.actions.base_action import ActionContext, BaseAction
 from core.actions.registry import ActionRegistry
-from core.ai_client.gemini_client import GeminiClient
-from core.ai_client.openai_client import OpenAIClient
-from core.logger import BasicLogger
+from core.config.run_config import (
+    DEFAULT_LOG_IO_DIR,
+    DEFAULT_REQUEST_FILE_PATTERN,
+    DEFAULT_RESPONSE_FILE_PATTERN,
+)
+from core.logger import get_logger
+
+
+# provider name -> (module, class) of its client, imported on first use
+_PROVIDER_CLIENTS: Dict[str, Tuple[str, str]] = {
+    "openai": ("core.ai_client.openai_client", "OpenAIClient"),
+    "gemini": ("core.ai_client.gemini_client", "GeminiClient"),
+}
 
 
 class RunResult:
+    __slots__ = (
+        "success",
+        "should_continue",
+        "should_break",
+        "change_strategy_requested",
+        "change_strategy_reason",
+        "change_strategy_name",
+        "change_strategy_method",
+        "retry_requested",
+        "retry_reason",
+    )
+
     def __init__(
         self,
         success: bool,
@@ -56,7 +79,7 @@ class AppRunner:
 
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root).resolve()
-        self.logger = BasicLogger("AppRunner").get_logger()
+        self.logger = get_logger("AppRunner")
         ActionRegistry.register_defaults()
 
     # ------------------------------------------------------------------
@@ -166,11 +189,14 @@ class AppRunner:
         return data
 
     def _create_client(self, provider: str) -> Any:
-        if provider == "openai":
-            return OpenAIClient(self.logger)
-        if provider == "gemini":
-            return GeminiClient(self.logger)
-        raise ValueError(f"Unsupported provider '{provider}'")
+        # Provider SDKs (openai, google-genai) are heavy to import; only load the one in use.
+        target = _PROVIDER_CLIENTS.get(provider)
+        if target is None:
+            raise ValueError(f"Unsupported provider '{provider}'")
+
+        module_name, class_name = target
+        client_cls = getattr(importlib.import_module(module_name), class_name)
+        return client_cls(self.logger)
 
     # ------------------------------------------------------------------
     # Agent input injection (rerun method vocabulary)
@@ -228,6 +254,9 @@ class AppRunner:
             agent_input.update(agent_input_overrides)
 
         context_block = self._load_context_block(context_files)
+        # Substitution values are the same for every message; render them once.
+        agent_input_json = json.dumps(agent_input, ensure_ascii=False)
+        task_text = task_description or ""
 
         messages: List[Dict[str, str]] = []
         for msg in profile.get("messages", []) or []:
@@ -239,9 +268,9 @@ class AppRunner:
             if not isinstance(role, str) or not isinstance(content, str):
                 continue
 
-            content = content.replace("${agent_input}", json.dumps(agent_input, ensure_ascii=False))
+            content = content.replace("${agent_input}", agent_input_json)
             content = content.replace("${rules_block}", "")
-            content = content.replace("${task_description}", task_description or "")
+            content = content.replace("${task_description}", task_text)
             content = content.replace("${context_block}", context_block)
 
             messages.append({"role": role, "content": content})
@@ -271,12 +300,10 @@ class AppRunner:
             if not p.is_absolute():
                 p = (self.project_root / p).resolve()
 
-            if not p.exists():
-                continue
-
+            # Missing files are skipped; opening directly avoids a separate stat per file.
             try:
                 raw = p.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
+            except (FileNotFoundError, UnicodeDecodeError):
                 continue
 
             blocks.append(f"=== CONTEXT FILE: {rel} ===\n{raw}")
@@ -294,15 +321,15 @@ class AppRunner:
         is_request: bool,
         content: Any,
     ) -> None:
-        log_dir_cfg = str(log_io_settings.get("log_dir", "logs/io"))
+        log_dir_cfg = str(log_io_settings.get("log_dir", DEFAULT_LOG_IO_DIR))
         log_dir = Path(log_dir_cfg)
         if not log_dir.is_absolute():
             log_dir = (self.project_root / log_dir).resolve()
 
         pattern = (
-            log_io_settings.get("request_file_pattern", "{run_name}__{attempt}__request.json")
+            log_io_settings.get("request_file_pattern", DEFAULT_REQUEST_FILE_PATTERN)
             if is_request
-            else log_io_settings.get("response_file_pattern", "{run_name}__{attempt}__response.json")
+            else log_io_settings.get("response_file_pattern", DEFAULT_RESPONSE_FILE_PATTERN)
         )
 
         filename = str(pattern).format(run_name=run_name, attempt=attempt)
@@ -310,8 +337,11 @@ class AppRunner:
         path = log_dir / filename
 
         try:
+            # Serialize up front so the file gets one write (json.dump issues many small ones)
+            # and a value that cannot be serialized never leaves a truncated log behind.
+            text = json.dumps(content, indent=2, ensure_ascii=False)
             with path.open("w", encoding="utf-8") as f:
-                json.dump(content, f, indent=2, ensure_ascii=False)
+                f.write(text)
             self.logger.info(
                 "[IO-LOG] %s saved to %s",
                 "Request" if is_request else "Response",
@@ -340,6 +370,14 @@ class AppRunner:
             content = message.get("content")
 
         if isinstance(content, str):
+            # Only a JSON object is acceptable; reject anything else without a full parse, but
+            # show how the content starts (e.g. a ``` code fence) so the failure is diagnosable.
+            stripped = content.lstrip()
+            if not stripped.startswith("{"):
+                raise ValueError(
+                    "Model response message content is not a JSON object "
+                    f"(content starts with {stripped[:40]!r})"
+                )
             try:
                 content = json.loads(content)
             except json.JSONDecodeError as e:
@@ -428,19 +466,31 @@ class AppRunner:
         return RunResult(success=True, should_continue=True)
 
 
-    @staticmethod
-    def _call_action_execute(action: BaseAction, ctx: ActionContext, params: Dict[str, Any]) -> None:
+    # action class -> number of execute() parameters (None if the signature can't be inspected)
+    _execute_param_counts: Dict[type, Optional[int]] = {}
+
+    @classmethod
+    def _call_action_execute(cls, action: BaseAction, ctx: ActionContext, params: Dict[str, Any]) -> None:
         """
         Defensive adapter for action.execute.
 
         Bound method signatures:
           - execute(ctx, params) -> 2 parameters (expected)
           - execute(ctx)        -> 1 parameter  (legacy only)
+
+        The signature is inspected once per action class and cached.
         """
-        try:
-            sig = inspect.signature(action.execute)
-            param_count = len(sig.parameters)
-        except (TypeError, ValueError):
+        action_cls = type(action)
+        if action_cls in cls._execute_param_counts:
+            param_count = cls._execute_param_counts[action_cls]
+        else:
+            try:
+                param_count = len(inspect.signature(action.execute).parameters)
+            except (TypeError, ValueError):
+                param_count = None
+            cls._execute_param_counts[action_cls] = param_count
+
+        if param_count is None:
             # Prefer modern contract first
             try:
                 action.execute(ctx, params)
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from core.config.run_config import RunConfig, RunItem, IncludeRuns
-from core.logger import BasicLogger
+from core.logger import get_logger
 from core.runtime.app_runner import RunResult
 from core.runtime.run_executor import RunExecutor
 from core.strategy.rerun_strategy import RerunStrategy
@@ -43,7 +43,7 @@ class PipelineRunner:
         self._rerun_attempts: Dict[Tuple[str, str, str, Union[str, int, Tuple[Any, ...]]], int] = {}
 
         self.executor = RunExecutor(project_root=str(self.project_root))
-        self.logger = BasicLogger("PipelineRunner").get_logger()
+        self.logger = get_logger("PipelineRunner")
 
         # Prevent accidental include cycles
         self._include_seen: Set[Path] = set()
@@ -114,12 +114,13 @@ class PipelineRunner:
             self.logger.info("Pipeline completed.")
             return
 
-        while index < len(runs):
-            if self.start_from is not None and index < self.start_from:
-                self.logger.info("[RUN SKIPPED] index=%s < start_from=%s", index, self.start_from)
-                index += 1
-                continue
+        # index never moves backwards in the loop below, so skipped runs can be jumped over
+        # once instead of being re-checked on every iteration.
+        if self.start_from is not None and self.start_from > 0:
+            self.logger.info("[RUN SKIPPED] indexes 0..%s < start_from=%s", self.start_from - 1, self.start_from)
+            index = self.start_from
 
+        while index < len(runs):
             step = runs[index]
 
             # v0.1: inline include_run / execute_run
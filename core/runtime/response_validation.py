@@ -1,10 +1,26 @@
 # core/runtime/response_validation.py
 from __future__ import annotations
 
+import importlib
+import json
+import sys
 from dataclasses import dataclass
+from types import ModuleType
 from typing import Any, Dict, List, Optional, Sequence
 
 
+# Optional dependencies resolved on first use; later calls skip the import machinery.
+_IMPORT_CACHE: Dict[str, ModuleType] = {}
+
+
+def _cached_import(module_name: str) -> ModuleType:
+    module = _IMPORT_CACHE.get(module_name)
+    if module is None:
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        _IMPORT_CACHE[module_name] = module
+    return module
+
+
 # ----------------------------
 # Exceptions
 # ----------------------------
@@ -41,7 +57,7 @@ class AllowedActionsPolicy:
 
     def __init__(self, allowed_actions: Optional[List[str]]):
         allowed_actions = allowed_actions or []
-        self._allowed = {a.strip() for a in allowed_actions if isinstance(a, str) and a.strip()}
+        self._allowed = frozenset(a.strip() for a in allowed_actions if isinstance(a, str) and a.strip())
 
     def enforce(self, actions: List[Dict[str, Any]]) -> None:
         if not self._allowed:
@@ -117,11 +133,17 @@ class JsonSchemaValidator:
 
     Hard constraint: if a schema is supplied and jsonschema is unavailable,
     we fail deterministically.
+
+    Schemas are checked and compiled into a validator once; later validations
+    against an equal schema reuse it.
     """
 
+    # canonical schema JSON -> compiled jsonschema validator
+    _compiled: Dict[str, Any] = {}
+
     def validate(self, instance: Dict[str, Any], schema: Dict[str, Any]) -> None:
         try:
-            import jsonschema  # type: ignore
+            jsonschema = _cached_import("jsonschema")
         except Exception as e:  # noqa: BLE001
             raise SchemaValidationError(
                 "jsonschema package is required for response schema validation but is not installed.",
@@ -129,12 +151,25 @@ class JsonSchemaValidator:
             ) from e
 
         try:
-            jsonschema.validate(instance=instance, schema=schema)
+            validator = self._get_validator(jsonschema, schema)
+            error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+            if error is not None:
+                raise error
         except jsonschema.ValidationError as e:  # type: ignore[attr-defined]
             raise SchemaValidationError("Response JSON failed schema validation.", details=str(e)) from e
         except jsonschema.SchemaError as e:  # type: ignore[attr-defined]
             raise SchemaValidationError("Provided JSON Schema is invalid.", details=str(e)) from e
 
+    def _get_validator(self, jsonschema: ModuleType, schema: Dict[str, Any]) -> Any:
+        key = json.dumps(schema, sort_keys=True)
+        validator = self._compiled.get(key)
+        if validator is None:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+            self._compiled[key] = validator
+        return validator
+
 
 class ResponseSchemaProvider:
     """
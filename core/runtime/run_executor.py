@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from core.config.run_config import RunItem
-from core.logger import BasicLogger
+from core.logger import get_logger
 from core.runtime.app_runner import AppRunner, RunResult
 
 
@@ -14,7 +14,7 @@ class RunExecutor:
 
     def __init__(self, project_root: str | Path):
         self.project_root = Path(project_root)
-        self.logger = BasicLogger("RunExecutor").get_logger()
+        self.logger = get_logger("RunExecutor")
         self.app_runner = AppRunner(project_root=self.project_root)
 
     def execute_once(
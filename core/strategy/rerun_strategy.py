@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RerunAttempt:
 
     profile_file: str
@@ -39,7 +39,7 @@ class RerunAttempt:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RerunBlock:
     name: Optional[str] = None
     method: Optional[str] = None
@@ -73,7 +73,7 @@ class RerunBlock:
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RerunStrategy:
 
     blocks: List[RerunBlock] = field(default_factory=list)
@@ -104,10 +104,11 @@ class RerunStrategy:
     @staticmethod
     def load(path: str | Path, *, require_unique_names: bool = True) -> "RerunStrategy":
         p = Path(path)
-        if not p.exists():
-            raise FileNotFoundError(f"rerun_strategy file not found: {p}")
+        try:
+            raw = p.read_text(encoding="utf-8")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"rerun_strategy file not found: {p}") from e
 
-        raw = p.read_text(encoding="utf-8")
         try:
             data = json.loads(raw)
         except json.JSONDecodeError as e:
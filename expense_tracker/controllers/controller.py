@@ -26,6 +26,10 @@ class CommandController:
         "additionalProperties": False,
     }
 
+    # Lookup sets derived once from the contract above; used for per-command validation.
+    _entities = frozenset(command_contract["properties"]["entity"]["enum"])
+    _actions = frozenset(command_contract["properties"]["action"]["enum"])
+
     def __init__(
         self,
         transaction_service: TransactionService,
@@ -50,16 +54,18 @@ class CommandController:
 
         entity = command.get("entity")
         action = command.get("action")
-        params = command.get("params", {}) if command.get("params") is not None else {}
+        params = command.get("params")
+        if params is None:
+            params = {}
 
-        if not isinstance(entity, str) or entity not in ("transaction", "category"):
+        if not isinstance(entity, str) or entity not in self._entities:
             self._logger.error("Command validation failed: invalid or missing 'entity'", {"entity": entity})
             return {
                 "error": "validation_error",
                 "details": "'entity' must be one of ['transaction', 'category']",
             }
 
-        if not isinstance(action, str) or action not in ("create", "list", "get", "update", "delete"):
+        if not isinstance(action, str) or action not in self._actions:
             self._logger.error("Command validation failed: invalid or missing 'action'", {"action": action})
             return {
                 "error": "validation_error",
@@ -76,7 +82,18 @@ class CommandController:
         try:
             if entity == "transaction":
                 svc = self._transaction_service
-                if action == "create":
+                if action == "create" and "records" in params:
+                    # Batch form: params.records is a list of records persisted with one load and one save
+                    records = params.get("records")
+                    if not isinstance(records, list):
+                        self._logger.error("Batch create command records must be a list", {"records": records})
+                        return {
+                            "error": "validation_error",
+                            "details": "create requires params.records to be a list of records with an 'id' field",
+                        }
+                    result = svc.create_many(records, data_dir)
+
+                elif action == "create":
                     record = params.get("record")
                     if not isinstance(record, dict) or "id" not in record:
                         self._logger.error("Create command missing required record or id", {"record": record})
@@ -128,7 +145,15 @@ class CommandController:
 
             else:  # entity == "category"
                 svc = self._category_service
-                if action == "create":
+                if action == "create" and "records" in params:
+                    # Batch create is only implemented for transactions; do not silently ignore it
+                    self._logger.error("Batch create is not supported for categories", {"params": params})
+                    return {
+                        "error": "validation_error",
+                        "details": "params.records is only supported for transaction create",
+                    }
+
+                elif action == "create":
                     record = params.get("record")
                     if not isinstance(record, dict) or "id" not in record:
                         self._logger.error("Create category missing required record or id", {"record": record})
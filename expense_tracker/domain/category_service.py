@@ -44,18 +44,16 @@ class CategoryService:
             self._logger.error("Category create failed: missing 'id' in params", category_params)
             raise ValueError("'id' is required in category_params")
 
-        existing = self._repository.load_all(data_dir)
-        # Check id uniqueness
         new_id = category_params['id']
-        for rec in existing:
-            if rec.get('id') == new_id:
-                self._logger.error("Category create conflict: id already exists", {'id': new_id})
-                raise ValueError(f"Category with id '{new_id}' already exists")
-
-        # Append and persist
-        updated = list(existing)  # shallow copy
-        updated.append(category_params)
-        self._repository.save_all(data_dir, updated)
+        existing, pos = self._repository.locate(data_dir, new_id)
+        # Check id uniqueness
+        if pos is not None:
+            self._logger.error("Category create conflict: id already exists", {'id': new_id})
+            raise ValueError(f"Category with id '{new_id}' already exists")
+
+        # Append and persist; load_all returns a freshly loaded list owned by this call
+        existing.append(category_params)
+        self._repository.save_all(data_dir, existing)
         self._logger.info("Category created", {'id': new_id})
         return category_params
 
@@ -84,10 +82,9 @@ class CategoryService:
 
     def get(self, record_id: str, data_dir: str) -> Optional[Dict[str, Any]]:
         """Retrieve a single category by id. Returns None if not found."""
-        all_categories = self._repository.load_all(data_dir)
-        for rec in all_categories:
-            if rec.get('id') == record_id:
-                return rec
+        all_categories, pos = self._repository.locate(data_dir, record_id)
+        if pos is not None:
+            return all_categories[pos]
 
         self._logger.info("Category not found", {'id': record_id})
         return None
@@ -99,47 +96,43 @@ class CategoryService:
             KeyError: if the target record is not found.
         Returns the updated record on success.
         """
-        all_categories = self._repository.load_all(data_dir)
-        updated = False
-        new_list: List[Dict[str, Any]] = []
-        updated_record: Optional[Dict[str, Any]] = None
-
-        for rec in all_categories:
-            if rec.get('id') == record_id:
-                # Do not allow changing the id via update_fields unless domain
-                # contract explicitly allows it; ignore 'id' in update_fields.
-                merged = dict(rec)
-                for k, v in update_fields.items():
-                    if k == 'id':
-                        continue
-                    merged[k] = v
-                updated_record = merged
-                new_list.append(merged)
-                updated = True
-            else:
-                new_list.append(rec)
-
-        if not updated or updated_record is None:
+        all_categories, pos = self._repository.locate(data_dir, record_id)
+        if pos is None:
             self._logger.info("Category update failed: not found", {'id': record_id})
             raise KeyError(f"Category with id '{record_id}' not found")
 
-        self._repository.save_all(data_dir, new_list)
+        # Do not allow changing the id via update_fields unless domain
+        # contract explicitly allows it; ignore 'id' in update_fields.
+        updated_record = dict(all_categories[pos])
+        for k, v in update_fields.items():
+            if k == 'id':
+                continue
+            updated_record[k] = v
+        current = all_categories[pos]
+        # Python equality treats 1, 1.0 and True alike, but they serialize differently; only
+        # skip the save when every field already holds a value of the same type. Containers
+        # may hide such differences inside, so any list/dict value is always written.
+        if all(
+            k == 'id' or (k in current and type(current[k]) is type(v) and type(v) not in (list, dict) and current[k] == v)
+            for k, v in (update_fields or {}).items()
+        ):
+            # Nothing changed; skip rewriting the file
+            self._logger.debug("Category update is a no-op; not saving", {'id': record_id})
+            return updated_record
+        # Replace the single match in place rather than rebuilding the list
+        all_categories[pos] = updated_record
+
+        self._repository.save_all(data_dir, all_categories)
         self._logger.info("Category updated", {'id': record_id})
         return updated_record
 
     def delete(self, record_id: str, data_dir: str) -> bool:
         """Delete a category by id. Returns True if removed, False if not found."""
-        all_categories = self._repository.load_all(data_dir)
-        new_list: List[Dict[str, Any]] = []
-        removed = False
-        for rec in all_categories:
-            if rec.get('id') == record_id:
-                removed = True
-                continue
-            new_list.append(rec)
-
-        if removed:
-            self._repository.save_all(data_dir, new_list)
+        all_categories, pos = self._repository.locate(data_dir, record_id)
+        # Ids are unique (enforced on create), so remove the single match in place.
+        if pos is not None:
+            del all_categories[pos]
+            self._repository.save_all(data_dir, all_categories)
             self._logger.info("Category deleted", {'id': record_id})
             return True
 
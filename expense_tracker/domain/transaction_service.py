@@ -33,22 +33,22 @@ class TransactionService:
 
         # Load existing transactions
         try:
-            existing = self._repository.load_all(data_dir) or []
+            existing, pos = self._repository.locate(data_dir, record_id)
         except Exception as exc:  # propagate repository exceptions after logging
             self._logger.error("Failed to load transactions for create", {"exception": exc})
             raise
 
         # Check uniqueness
-        for rec in existing:
-            if rec.get("id") == record_id:
-                self._logger.error("Transaction id conflict on create", {"id": record_id})
-                return {"error": "conflict", "message": f"Transaction with id {record_id} already exists"}
+        if pos is not None:
+            self._logger.error("Transaction id conflict on create", {"id": record_id})
+            return {"error": "conflict", "message": f"Transaction with id {record_id} already exists"}
 
         # Append and persist
         new_record = dict(transaction_params)  # shallow copy to avoid external mutation
-        updated = list(existing) + [new_record]
+        # load_all returns a freshly loaded list owned by this call; extend it in place
+        existing.append(new_record)
         try:
-            self._repository.save_all(data_dir, updated)
+            self._repository.save_all(data_dir, existing)
         except Exception as exc:
             self._logger.error("Failed to save transactions on create", {"exception": exc})
             raise
@@ -56,6 +56,65 @@ class TransactionService:
         self._logger.info("Transaction created", {"id": record_id})
         return new_record
 
+    def create_many(self, records: List[Dict[str, Any]], data_dir: str) -> dict:
+        """Create several transactions with a single load and a single save.
+
+        All records are validated (identity field present, no duplicates within the batch or
+        against persisted records) before anything is written, so the batch is all-or-nothing.
+        Returns {"created": [...]} on success or a structured error dict on validation/conflict.
+        """
+        if not isinstance(records, list):
+            self._logger.error("Transaction batch create validation failed: records must be a list", records)
+            return {"error": "validation", "message": "records must be a list"}
+
+        batch_ids = set()
+        for idx, rec in enumerate(records):
+            if not isinstance(rec, dict) or "id" not in rec:
+                self._logger.error("Transaction batch create validation failed: missing id", {"index": idx})
+                return {"error": "validation", "message": f"Missing required field: id (records[{idx}])"}
+            try:
+                duplicate = rec["id"] in batch_ids
+            except TypeError:  # unhashable id (list/dict) cannot be checked for duplicates
+                self._logger.error("Transaction batch create validation failed: unsupported id type", {"index": idx})
+                return {"error": "validation", "message": f"Unsupported id type {type(rec['id']).__name__} (records[{idx}])"}
+            if duplicate:
+                self._logger.error("Transaction id duplicated within batch", {"id": rec["id"]})
+                return {"error": "conflict", "message": f"Transaction with id {rec['id']} appears more than once"}
+            batch_ids.add(rec["id"])
+
+        if not records:
+            return {"created": []}
+
+        try:
+            existing = self._repository.load_all(data_dir) or []
+        except Exception as exc:
+            self._logger.error("Failed to load transactions for batch create", {"exception": exc})
+            raise
+
+        # Same matching rule as create()/locate: only dict records that carry an 'id' can clash
+        # ({"_raw": ...} wrappers have none), and an unhashable stored id cannot equal a batch id.
+        for rec in existing:
+            if type(rec) is not dict or "id" not in rec:
+                continue
+            try:
+                clash = rec["id"] in batch_ids
+            except TypeError:
+                continue
+            if clash:
+                self._logger.error("Transaction id conflict on batch create", {"id": rec["id"]})
+                return {"error": "conflict", "message": f"Transaction with id {rec['id']} already exists"}
+
+        new_records = [dict(rec) for rec in records]  # shallow copies to avoid external mutation
+        existing.extend(new_records)
+        try:
+            self._repository.save_all(data_dir, existing)
+        except Exception as exc:
+            self._logger.error("Failed to save transactions on batch create", {"exception": exc})
+            raise
+
+        self._logger.info("Transactions created", {"count": len(new_records)})
+        return {"created": new_records}
+
     def list(self, query_params: Dict[str, Any], data_dir: str) -> List[Dict[str, Any]]:
         """Return a list of transactions, optionally filtered in-memory by simple equality matching.
 
@@ -80,7 +139,7 @@ class TransactionService:
 
             filtered = [r for r in records if matches(r)]
         else:
-            filtered = list(records)
+            filtered = records
 
         self._logger.debug("Listed transactions", {"count": len(filtered)})
         return filtered
@@ -88,14 +147,13 @@ class TransactionService:
     def get(self, record_id: str, data_dir: str) -> Optional[Dict[str, Any]]:
         """Return the transaction dict with matching id or None if not found."""
         try:
-            records = self._repository.load_all(data_dir) or []
+            records, pos = self._repository.locate(data_dir, record_id)
         except Exception as exc:
             self._logger.error("Failed to load transactions for get", {"exception": exc})
             raise
 
-        for rec in records:
-            if rec.get("id") == record_id:
-                return rec
+        if pos is not None:
+            return records[pos]
 
         self._logger.info("Transaction not found", {"id": record_id})
         return None
@@ -107,65 +165,62 @@ class TransactionService:
         Returns the updated record on success or a structured error dict if not found.
         """
         try:
-            records = self._repository.load_all(data_dir) or []
+            records, pos = self._repository.locate(data_dir, record_id)
         except Exception as exc:
             self._logger.error("Failed to load transactions for update", {"exception": exc})
             raise
 
-        found = False
-        updated_record: Optional[Dict[str, Any]] = None
-        updated_list: List[Dict[str, Any]] = []
-
-        for rec in records:
-            if rec.get("id") == record_id:
-                found = True
-                # Apply updates conservatively; do not change id
-                new_rec = dict(rec)
-                for k, v in (update_fields or {}).items():
-                    if k == "id":
-                        continue
-                    new_rec[k] = v
-                updated_record = new_rec
-                updated_list.append(new_rec)
-            else:
-                updated_list.append(rec)
-
-        if not found:
+        if pos is None:
             self._logger.info("Transaction update attempted but not found", {"id": record_id})
             return {"error": "not_found", "message": f"Transaction with id {record_id} not found"}
 
+        # Apply updates conservatively; do not change id
+        updated_record = dict(records[pos])
+        for k, v in (update_fields or {}).items():
+            if k == "id":
+                continue
+            updated_record[k] = v
+        current = records[pos]
+        # Python equality treats 1, 1.0 and True alike, but they serialize differently; only
+        # skip the save when every field already holds a value of the same type. Containers
+        # may hide such differences inside, so any list/dict value is always written.
+        if all(
+            k == "id" or (k in current and type(current[k]) is type(v) and type(v) not in (list, dict) and current[k] == v)
+            for k, v in (update_fields or {}).items()
+        ):
+            # Nothing changed; skip rewriting the file
+            self._logger.debug("Transaction update is a no-op; not saving", {"id": record_id})
+            return updated_record
+        # Replace the single match in the freshly loaded list instead of rebuilding it
+        records[pos] = updated_record
+
         try:
-            self._repository.save_all(data_dir, updated_list)
+            self._repository.save_all(data_dir, records)
         except Exception as exc:
             self._logger.error("Failed to save transactions on update", {"exception": exc})
             raise
 
         self._logger.info("Transaction updated", {"id": record_id})
-        # updated_record is guaranteed to be set when found is True
-        return updated_record or {}
+        return updated_record
 
     def delete(self, record_id: str, data_dir: str) -> bool:
         """Delete the transaction with the given id. Return True if deleted, False if not found."""
         try:
-            records = self._repository.load_all(data_dir) or []
+            records, pos = self._repository.locate(data_dir, record_id)
         except Exception as exc:
             self._logger.error("Failed to load transactions for delete", {"exception": exc})
             raise
 
-        new_list: List[Dict[str, Any]] = []
-        deleted = False
-        for rec in records:
-            if rec.get("id") == record_id:
-                deleted = True
-            else:
-                new_list.append(rec)
-
-        if not deleted:
+        if pos is None:
             self._logger.info("Transaction delete attempted but not found", {"id": record_id})
             return False
 
+        # Ids are unique (enforced on create), so remove the single match in place
+        # rather than rebuilding the list.
+        del records[pos]
+
         try:
-            self._repository.save_all(data_dir, new_list)
+            self._repository.save_all(data_dir, records)
         except Exception as exc:
             self._logger.error("Failed to save transactions on delete", {"exception": exc})
             raise
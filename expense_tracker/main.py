@@ -1,4 +1,3 @@
-from typing import Any
 import json
 
 from app.application import Application
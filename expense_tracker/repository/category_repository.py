@@ -1,6 +1,6 @@
 from storage.json_storage import JsonStorage
 from app_logging import AppLogger
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 
@@ -50,6 +50,15 @@ class CategoryRepository:
         # No domain-model conversion is performed; return JSON-serializable dicts
         return raw
 
+    def locate(self, data_dir: str, record_id: Any) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Load all categories and return them with the position of the record whose 'id' is record_id.
+
+        The position is None when no record matches; callers can then replace or delete the
+        record in the returned list without rebuilding it.
+        """
+        records = self.load_all(data_dir)
+        return records, self._storage.position_of(records, "id", record_id)
+
     def save_all(self, data_dir: str, categories: List[Dict[str, Any]]) -> None:
         """Persist the provided list of category records atomically via JsonStorage.
 
@@ -60,15 +69,17 @@ class CategoryRepository:
         if not isinstance(categories, list):
             raise TypeError("categories must be a list of dicts")
 
-        serializable_data: List[Dict[str, Any]] = []
-        for idx, rec in enumerate(categories):
-            if not isinstance(rec, dict):
-                self._logger.error("Category record is not a dict and cannot be serialized", {"index": idx, "file_path": file_path})
-                raise TypeError("Each category record must be a dict")
-            if "id" not in rec:
-                self._logger.error("Category record missing required 'id' field", {"index": idx, "record": rec, "file_path": file_path})
-                raise ValueError("Each category record must contain an 'id' field")
-            serializable_data.append(rec)
+        # A single pass covers the valid case; the indexed walk only runs to report a failure.
+        if not all(isinstance(rec, dict) and "id" in rec for rec in categories):
+            for idx, rec in enumerate(categories):
+                if not isinstance(rec, dict):
+                    self._logger.error("Category record is not a dict and cannot be serialized", {"index": idx, "file_path": file_path})
+                    raise TypeError("Each category record must be a dict")
+                if "id" not in rec:
+                    self._logger.error("Category record missing required 'id' field", {"index": idx, "record": rec, "file_path": file_path})
+                    raise ValueError("Each category record must contain an 'id' field")
+
+        serializable_data: List[Dict[str, Any]] = categories
 
         try:
             self._storage.write(file_path, serializable_data)
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 from storage.json_storage import JsonStorage
@@ -44,19 +44,32 @@ class TransactionRepository:
             self._logger.error("Unexpected data shape for transactions; expected list", {"file_path": file_path, "type": type(raw).__name__})
             return []
 
-        records: List[Dict[str, Any]] = []
-        for idx, item in enumerate(raw):
-            if isinstance(item, dict):
-                records.append(item)
-            else:
-                # Convert non-dict items conservatively into a dict wrapper so callers receive a consistent type.
-                # This is a minimal deterministic conversion to satisfy the manifest's expectation of dicts.
-                self._logger.debug("Converting non-dict transaction item to dict wrapper", {"index": idx, "file_path": file_path})
-                records.append({"_raw": item})
+        # Common case: every item is already a dict and the parsed list can be returned as-is.
+        if all(type(item) is dict for item in raw):
+            records: List[Dict[str, Any]] = raw
+        else:
+            records = []
+            for idx, item in enumerate(raw):
+                if isinstance(item, dict):
+                    records.append(item)
+                else:
+                    # Convert non-dict items conservatively into a dict wrapper so callers receive a consistent type.
+                    # This is a minimal deterministic conversion to satisfy the manifest's expectation of dicts.
+                    self._logger.debug("Converting non-dict transaction item to dict wrapper", {"index": idx, "file_path": file_path})
+                    records.append({"_raw": item})
 
         self._logger.debug("Loaded transactions", {"file_path": file_path, "count": len(records)})
         return records
 
+    def locate(self, data_dir: str, record_id: Any) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Load all transactions and return them with the position of the record whose 'id' is record_id.
+
+        The position is None when no record matches; callers can then replace or delete the
+        record in the returned list without rebuilding it.
+        """
+        records = self.load_all(data_dir)
+        return records, self._storage.position_of(records, "id", record_id)
+
     def save_all(self, data_dir: str, transactions: List[Dict[str, Any]]) -> None:
         """Persist the provided list of transaction dicts to transactions.json under data_dir.
 
@@ -66,16 +79,18 @@ class TransactionRepository:
         """
         file_path = os.path.join(data_dir, "transactions.json")
 
-        # Validate records satisfy required schema (each must have an 'id')
-        for idx, rec in enumerate(transactions):
-            if not isinstance(rec, dict):
-                msg = "Transaction record is not a dict"
-                self._logger.error(msg, {"index": idx, "file_path": file_path, "record_type": type(rec).__name__})
-                raise ValueError(f"Transaction at index {idx} is not a dict")
-            if "id" not in rec:
-                msg = "Transaction record missing required 'id' field"
-                self._logger.error(msg, {"index": idx, "file_path": file_path, "record": rec})
-                raise ValueError(f"Transaction at index {idx} missing required 'id' field")
+        # Validate records satisfy required schema (each must have an 'id').
+        # A single pass covers the valid case; the indexed walk only runs to report a failure.
+        if not all(isinstance(rec, dict) and "id" in rec for rec in transactions):
+            for idx, rec in enumerate(transactions):
+                if not isinstance(rec, dict):
+                    msg = "Transaction record is not a dict"
+                    self._logger.error(msg, {"index": idx, "file_path": file_path, "record_type": type(rec).__name__})
+                    raise ValueError(f"Transaction at index {idx} is not a dict")
+                if "id" not in rec:
+                    msg = "Transaction record missing required 'id' field"
+                    self._logger.error(msg, {"index": idx, "file_path": file_path, "record": rec})
+                    raise ValueError(f"Transaction at index {idx} missing required 'id' field")
 
         serializable_data = transactions  # Assume callers supply JSON-serializable primitives per manifest
 
@@ -5,6 +5,16 @@ import json
 import tempfile
 import os
 import io
+import mmap
+
+try:  # Optional accelerator; stdlib json is used when it is not installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Files at least this large are mapped into memory rather than read into a bytes copy; below it
+# the mmap setup costs more than the copy it saves.
+MMAP_READ_THRESHOLD = 64 * 1024
 
 
 class JsonStorage:
@@ -13,25 +23,65 @@ class JsonStorage:
     Responsibilities (per manifest):
     - read(file_path) -> Optional[Any]: return parsed JSON or None if missing
     - write(file_path, data): atomic write using a temporary file in same directory
+    - position_of(records, key, value): position of the first record with record[key] == value
 
     Uses injected AppLogger for logging.
     """
 
-    def __init__(self, logger: AppLogger) -> None:
-        # Store injected logger. Do not perform I/O here.
+    def __init__(self, logger: AppLogger, fsync_on_write: bool = True) -> None:
+        """Store injected dependencies. Do not perform I/O here.
+
+        fsync_on_write=False skips the fsync before the atomic replace. The write stays atomic
+        (readers never see a partial file) but may be lost on power failure; use it for scratch
+        or read-mostly data directories where that trade-off is acceptable.
+        """
         self._logger = logger
+        self._fsync_on_write = fsync_on_write
+        # Encoder options never change between writes; build the encoder once instead of
+        # letting json.dumps construct a fresh JSONEncoder on every call.
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    @staticmethod
+    def position_of(records: Any, key: str, value: Any) -> Optional[int]:
+        """Return the position of the first dict in records whose record[key] equals value.
+
+        Non-dict items are skipped and unhashable values are fine, since this is a plain
+        equality scan; returns None when nothing matches or records is not a list.
+        """
+        if type(records) is not list:
+            return None
+        for pos, rec in enumerate(records):
+            if type(rec) is dict and key in rec and rec[key] == value:
+                return pos
+        return None
 
     def read(self, file_path: str) -> Optional[Any]:
         """Read and parse JSON from file_path.
 
         Returns the parsed JSON-serializable structure, or None if file is missing.
+        Parsing uses orjson when it is installed, otherwise stdlib json.
         On I/O or parse errors, logs and re-raises the exception.
         """
         try:
+            if orjson is not None:
+                with io.open(file_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size >= MMAP_READ_THRESHOLD:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            with memoryview(mm) as view:
+                                try:
+                                    return orjson.loads(view)
+                                except orjson.JSONDecodeError:
+                                    return json.loads(str(view, "utf-8"))
+                    raw = f.read()
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # orjson is stricter than stdlib json (e.g. NaN/Infinity); let stdlib decide.
+                    return json.loads(raw.decode("utf-8"))
+
             # Use io.open to be explicit about encoding
             with io.open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data
+                return json.load(f)
         except FileNotFoundError:
             # Missing file is treated as bootstrap-safe empty result
             try:
@@ -52,9 +102,13 @@ class JsonStorage:
         """Atomically write JSON-serializable `data` to `file_path`.
 
         Steps:
-        1) Serialize to JSON text using json.dumps(..., ensure_ascii=False, separators=(',', ':'))
-        2) Create a temporary file in the same directory using tempfile.NamedTemporaryFile(delete=False)
-        3) Write bytes, flush, and fsync
+        1) Serialize to compact UTF-8 JSON with the precomputed stdlib encoder
+           (ensure_ascii=False, separators=(',', ':')). orjson is only used for reads: it
+           writes NaN/Infinity as null and accepts types (date, UUID, Enum, ...) that stdlib
+           rejects, so whether a write succeeds would depend on an optional package
+        2) Create a temporary file in the same directory using tempfile.mkstemp
+        3) Write the bytes straight to the descriptor with os.write (normally one syscall),
+           then fsync (unless disabled via fsync_on_write=False)
         4) Atomically replace target with os.replace
         On error, attempts to clean up temporary file and propagates the exception.
         """
@@ -64,23 +118,27 @@ class JsonStorage:
             # Ensure directory exists to avoid needless failures when writing
             os.makedirs(dir_name, exist_ok=True)
 
-            # Serialize to JSON text and encode to bytes
-            json_text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-            json_bytes = json_text.encode("utf-8")
+            # Serialize to JSON bytes
+            json_bytes = self._encoder.encode(data).encode("utf-8")
 
-            # Create a temporary file in the same directory
-            with tempfile.NamedTemporaryFile(mode="wb", delete=False, dir=dir_name) as tmpf:
-                tmp_file_path = tmpf.name
-                tmpf.write(json_bytes)
-                tmpf.flush()
-                try:
-                    os.fsync(tmpf.fileno())
-                except Exception:
-                    # If fsync is not available or fails, log and continue to attempt atomic replace
+            # Create a temporary file in the same directory and write it without a buffered
+            # file object; os.write may write less than asked, so loop until done.
+            fd, tmp_file_path = tempfile.mkstemp(dir=dir_name)
+            try:
+                view = memoryview(json_bytes)
+                while view:
+                    view = view[os.write(fd, view):]
+                if self._fsync_on_write:
                     try:
-                        self._logger.debug("json_storage.write: fsync failed or not supported", {"tmp_path": tmp_file_path})
+                        os.fsync(fd)
                     except Exception:
-                        pass
+                        # If fsync is not available or fails, log and continue to attempt atomic replace
+                        try:
+                            self._logger.debug("json_storage.write: fsync failed or not supported", {"tmp_path": tmp_file_path})
+                        except Exception:
+                            pass
+            finally:
+                os.close(fd)
 
             # Atomically replace the target file with the temporary file
             os.replace(tmp_file_path, file_path)
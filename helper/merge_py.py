@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 
 OUTPUT_NAME = "merged_all_library.txt"
@@ -20,30 +21,81 @@ INCLUDED_FILES = [
 
 ALLOWED_EXTENSIONS = {".py"}  # extend if needed, e.g. {".py", ".json"}
 
+# Directory names never descended into (VCS metadata, caches, virtualenvs, build output)
+SKIP_DIRS = frozenset({
+    ".git", "__pycache__", ".venv", "venv", "node_modules",
+    ".mypy_cache", ".pytest_cache", ".tox", "dist", "build",
+})
+
+COPY_CHUNK_SIZE = 1024 * 1024  # stream file bodies in 1 MiB chunks
+
+# Output separators, pre-encoded once and always LF-terminated. File bodies are copied
+# verbatim: line endings (CRLF included) and non-UTF-8 bytes are kept exactly as on disk.
+_RULE = b"#" * 90
+_HEADER_FMT = b"\n%s\n# FILE: %s\n%s\n\n"
+_BLANK = b"\n\n"
+
 
 def _safe_abspath(path: str) -> str:
     return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
 
 
-def _is_allowed_file(path: str, output_name: str) -> bool:
-    if os.path.basename(path) == output_name:
+def _is_allowed_name(name: str, output_name: str) -> bool:
+    if name == output_name:
         return False
 
-    if os.path.basename(path) == LICENSE_NAME:
+    if name == LICENSE_NAME:
         return True
 
-    _, ext = os.path.splitext(path)
+    _, ext = os.path.splitext(name)
     return ext in ALLOWED_EXTENSIONS
 
 
+def _is_allowed_file(path: str, output_name: str) -> bool:
+    return _is_allowed_name(os.path.basename(path), output_name)
+
+
+def _iter_files(root: str, output_name: str):
+    """Yield DirEntry objects for allowed non-directory entries under root (symlinked directories and SKIP_DIRS are not followed).
+
+    Uses os.scandir so file/dir checks come from the directory entry instead of extra stat
+    calls, and filters on the entry name before the file check. Paths are joined onto root,
+    so an absolute, normalized root yields absolute, normalized paths without further
+    processing.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable directory: skip, as os.walk does
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif _is_allowed_name(entry.name, output_name) and not entry.is_dir():
+                    # Same entries os.walk lists as files: anything that does not resolve to a
+                    # directory, including broken symlinks (merged with an error marker).
+                    yield entry
+
+
 def collect_all_files(
     included_dirs: list[str],
     included_files: list[str],
     output_name: str,
 ) -> list[str]:
 
-    files: list[str] = []
-    seen: set[str] = set()
+    # Keyed by real path so a file reached through a symlink (or a symlinked root) is merged
+    # once. When several paths alias one file, a non-symlink path wins over a symlink and ties
+    # go to the smallest path, so the result does not depend on directory-listing order.
+    chosen: dict[str, tuple[bool, str]] = {}
+
+    def _add(path: str, real: str, is_link: bool) -> None:
+        candidate = (is_link, path)
+        current = chosen.get(real)
+        if current is None or candidate < current:
+            chosen[real] = candidate
 
     for fpath in included_files:
         fpath = _safe_abspath(fpath)
@@ -53,50 +105,65 @@ def collect_all_files(
         if not _is_allowed_file(fpath, output_name):
             continue
 
-        if fpath not in seen:
-            files.append(fpath)
-            seen.add(fpath)
+        _add(fpath, os.path.realpath(fpath), os.path.islink(fpath))
 
     for base_dir in included_dirs:
         base_dir = _safe_abspath(base_dir)
         if not os.path.isdir(base_dir):
             continue
 
-        for dirpath, _, filenames in os.walk(base_dir):
-            for fname in filenames:
-                full_path = _safe_abspath(os.path.join(dirpath, fname))
-
-                if full_path in seen:
-                    continue
-
-                if not _is_allowed_file(full_path, output_name):
-                    continue
-
-                files.append(full_path)
-                seen.add(full_path)
-
-    return sorted(files)
+        # Directory symlinks are not followed below the root, so only the root itself and
+        # symlinked files need resolving; every other path maps onto the resolved root.
+        real_base = os.path.realpath(base_dir)
+        for entry in _iter_files(base_dir, output_name):
+            full_path = entry.path
+            if entry.is_symlink():
+                _add(full_path, os.path.realpath(full_path), True)
+            else:
+                _add(full_path, real_base + full_path[len(base_dir):], False)
+
+    return sorted(path for _, path in chosen.values())
+
+
+def _copy_body(src, out) -> None:
+    """Append the whole of binary file src to binary file out.
+
+    Uses os.sendfile where available so the bytes move inside the kernel; falls back to a
+    chunked user-space copy when sendfile is missing or refuses these file types.
+    """
+    offset = 0
+    if hasattr(os, "sendfile"):
+        out.flush()  # buffered header bytes must land before the kernel appends the body
+        out_fd, in_fd = out.fileno(), src.fileno()
+        size = os.fstat(in_fd).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                if sent == 0:
+                    break  # file shrank underneath us; copy whatever remains below
+                offset += sent
+        except OSError:
+            pass
+    src.seek(offset)
+    shutil.copyfileobj(src, out, COPY_CHUNK_SIZE)
 
 
 def merge_all(files: list[str], output_path: str) -> None:
     out_dir = os.path.dirname(_safe_abspath(output_path))
 
-    with open(output_path, "w", encoding="utf-8") as out:
+    with open(output_path, "wb", buffering=COPY_CHUNK_SIZE) as out:
         for fpath in files:
             rel_path = os.path.relpath(fpath, start=out_dir)
 
-            out.write("\n")
-            out.write("#" * 90 + "\n")
-            out.write(f"# FILE: {rel_path}\n")
-            out.write("#" * 90 + "\n\n")
+            out.write(_HEADER_FMT % (_RULE, rel_path.encode("utf-8"), _RULE))
 
             try:
-                with open(fpath, "r", encoding="utf-8") as src:
-                    out.write(src.read())
+                with open(fpath, "rb") as src:
+                    _copy_body(src, out)
             except Exception as e:
-                out.write(f"!! ERROR READING FILE: {e} !!")
+                out.write(f"!! ERROR READING FILE: {e} !!".encode("utf-8"))
 
-            out.write("\n\n")
+            out.write(_BLANK)
 
     print(f"Merged {len(files)} files into: {output_path}")
 
@@ -5,35 +5,74 @@ import os
 from datetime import datetime, timezone
 from typing import Optional, Tuple
 
+try:  # Optional accelerator; stdlib json is used when it is not installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 PRICE_PER_1K_TOKENS = 0.0
 
+_RESPONSE_SUFFIXES = ("_response.json", "_response")
+
+# Shared stand-in for a missing/empty "usage" object; only ever read.
+_EMPTY: dict = {}
+
 
 def looks_like_response_file(filename: str) -> bool:
     """Return True if filename should be treated as an API response JSON file."""
-    lower = filename.lower()
-    return lower.endswith("_response.json") or lower.endswith("_response")
+    # Names are usually lowercase already; only lowercase when the direct check misses.
+    return filename.endswith(_RESPONSE_SUFFIXES) or filename.lower().endswith(_RESPONSE_SUFFIXES)
 
 
-def load_json_safe(path: str) -> Optional[dict]:
-    """Load JSON file, return dict or None on error."""
+def _read_bytes_safe(path: str) -> Optional[bytes]:
+    """Read a file's raw bytes, return None on error."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return f.read()
     except Exception as exc:  # noqa: BLE001
         print(f"[WARN] Failed to load JSON from {path}: {exc}")
         return None
 
 
+def _parse_json_safe(raw: bytes, path: str) -> Optional[dict]:
+    """Parse UTF-8 JSON bytes read from path, return dict or None on error.
+
+    Parsing uses orjson when it is installed, otherwise stdlib json.
+    """
+    try:
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than stdlib json (e.g. NaN/Infinity); let stdlib decide.
+                pass
+        return json.loads(raw.decode("utf-8"))
+    except Exception as exc:  # noqa: BLE001
+        print(f"[WARN] Failed to load JSON from {path}: {exc}")
+        return None
+
+
+def load_json_safe(path: str) -> Optional[dict]:
+    """Load JSON file, return dict or None on error."""
+    raw = _read_bytes_safe(path)
+    if raw is None:
+        return None
+    return _parse_json_safe(raw, path)
+
+
 def extract_usage(entry: dict) -> Tuple[int, int, int]:
     """
     Extract (total_tokens, prompt_tokens, completion_tokens) from a response dict.
     Missing fields are treated as 0.
     """
-    usage = entry.get("usage", {}) or {}
-    total_tokens = int(usage.get("total_tokens", 0) or 0)
-    prompt_tokens = int(usage.get("prompt_tokens", 0) or 0)
-    completion_tokens = int(usage.get("completion_tokens", 0) or 0)
-    return total_tokens, prompt_tokens, completion_tokens
+    usage = entry.get("usage") or _EMPTY
+    total_tokens = usage.get("total_tokens", 0)
+    prompt_tokens = usage.get("prompt_tokens", 0)
+    completion_tokens = usage.get("completion_tokens", 0)
+    # Well-formed responses already carry plain ints; skip the coercion for them.
+    if type(total_tokens) is int and type(prompt_tokens) is int and type(completion_tokens) is int:
+        return total_tokens, prompt_tokens, completion_tokens
+    return int(total_tokens or 0), int(prompt_tokens or 0), int(completion_tokens or 0)
 
 
 def extract_created(entry: dict) -> Optional[int]:
@@ -49,6 +88,21 @@ def extract_created(entry: dict) -> Optional[int]:
         return None
 
 
+def _process_file(path: str) -> Optional[Tuple[int, int, int, Optional[int]]]:
+    """
+    Load one response file and return (total, prompt, completion, created),
+    or None if it could not be loaded.
+    """
+    raw = _read_bytes_safe(path)
+    if raw is None:
+        return None
+    entry = _parse_json_safe(raw, path)
+    if entry is None:
+        return None
+    total_tokens, prompt_tokens, completion_tokens = extract_usage(entry)
+    return total_tokens, prompt_tokens, completion_tokens, extract_created(entry)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description=(
@@ -86,20 +140,21 @@ def main() -> None:
     earliest_created: Optional[int] = None
     latest_created: Optional[int] = None
 
-    for name in os.listdir(base_dir):
-        if not looks_like_response_file(name):
+    # scandir yields the entry type with the listing, so the is_file() check below
+    # normally needs no extra stat per file; the name filter runs before it.
+    with os.scandir(base_dir) as it:
+        paths = [
+            dir_entry.path
+            for dir_entry in it
+            if looks_like_response_file(dir_entry.name) and dir_entry.is_file()
+        ]
+
+    for path in paths:
+        result = _process_file(path)
+        if result is None:
             continue
 
-        full_path = os.path.join(base_dir, name)
-        if not os.path.isfile(full_path):
-            continue
-
-        entry = load_json_safe(full_path)
-        if entry is None:
-            continue
-
-        total_tokens, prompt_tokens, completion_tokens = extract_usage(entry)
-        created_ts = extract_created(entry)
+        total_tokens, prompt_tokens, completion_tokens, created_ts = result
 
         total_tokens_sum += total_tokens
         prompt_tokens_sum += prompt_tokens
@@ -112,39 +167,42 @@ def main() -> None:
             if latest_created is None or created_ts > latest_created:
                 latest_created = created_ts
 
-    print("=== NexusArbiter Token Usage Summary ===")
-    print(f"Directory:           {os.path.abspath(base_dir)}")
-    print(f"Response files used: {file_count}")
-    print()
+    # Assemble the report and write it once rather than one print() per line.
+    lines = ["=== NexusArbiter Token Usage Summary ==="]
+    lines.append(f"Directory:           {os.path.abspath(base_dir)}")
+    lines.append(f"Response files used: {file_count}")
+    lines.append("")
 
-    print(f"Total tokens:        {total_tokens_sum}")
-    print(f"  Prompt tokens:     {prompt_tokens_sum}")
-    print(f"  Completion tokens: {completion_tokens_sum}")
-    print()
+    lines.append(f"Total tokens:        {total_tokens_sum}")
+    lines.append(f"  Prompt tokens:     {prompt_tokens_sum}")
+    lines.append(f"  Completion tokens: {completion_tokens_sum}")
+    lines.append("")
 
     if price_per_1k > 0 and total_tokens_sum > 0:
         cost = (total_tokens_sum / 1000.0) * price_per_1k
-        print(f"Price per 1K tokens: {price_per_1k}")
-        print(f"Estimated cost:      {cost}")
-        print()
+        lines.append(f"Price per 1K tokens: {price_per_1k}")
+        lines.append(f"Estimated cost:      {cost}")
+        lines.append("")
     else:
-        print(
+        lines.append(
             "Estimated cost:      (set --price-per-1k or PRICE_PER_1K_TOKENS "
             "to compute cost)"
         )
-        print()
+        lines.append("")
 
     if earliest_created is not None and latest_created is not None:
         earliest_dt = datetime.fromtimestamp(earliest_created, tz=timezone.utc)
         latest_dt = datetime.fromtimestamp(latest_created, tz=timezone.utc)
         span_seconds = latest_created - earliest_created
 
-        print("Time span (from 'created' fields):")
-        print(f"  Earliest:          {earliest_dt.isoformat()}")
-        print(f"  Latest:            {latest_dt.isoformat()}")
-        print(f"  Span (seconds):    {span_seconds}")
+        lines.append("Time span (from 'created' fields):")
+        lines.append(f"  Earliest:          {earliest_dt.isoformat()}")
+        lines.append(f"  Latest:            {latest_dt.isoformat()}")
+        lines.append(f"  Span (seconds):    {span_seconds}")
     else:
-        print("Time span:           No valid 'created' timestamps found.")
+        lines.append("Time span:           No valid 'created' timestamps found.")
+
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
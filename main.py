@@ -1,25 +1,28 @@
 from __future__ import annotations
 
 import sys
-from cli import main as cli_main
 
 
 def main() -> None:
+    from cli import main as cli_main
+
     # Backward-compatible shim:
     # python main.py --config X  ->  nexusarbiter run X
     argv = sys.argv[1:]
 
-    if "--config" in argv:
-        i = argv.index("--config")
-        cfg = argv[i + 1] if i + 1 < len(argv) else None
+    # One pass over argv: value following the first occurrence of each legacy flag
+    legacy: dict[str, str | None] = {}
+    for i, tok in enumerate(argv):
+        if tok in ("--config", "--startfrom") and tok not in legacy:
+            legacy[tok] = argv[i + 1] if i + 1 < len(argv) else None
+
+    if "--config" in legacy:
+        cfg = legacy["--config"]
         if not cfg:
             raise SystemExit(2)
 
         # map legacy --startfrom to --start-from
-        start_from = None
-        if "--startfrom" in argv:
-            j = argv.index("--startfrom")
-            start_from = argv[j + 1] if j + 1 < len(argv) else None
+        start_from = legacy.get("--startfrom")
 
         new_argv = ["run", cfg]
         if start_from is not None:
@@ -0,0 +1,235 @@
+# tests/test_expense_tracker.py
+from __future__ import annotations
+
+import json
+import sys
+import uuid
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+# expense_tracker uses top-level imports (e.g. "from storage.json_storage import JsonStorage").
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "expense_tracker"))
+
+from app_logging import AppLogger  # noqa: E402
+from controllers.controller import CommandController  # noqa: E402
+from domain.category_service import CategoryService  # noqa: E402
+from domain.transaction_service import TransactionService  # noqa: E402
+from repository.category_repository import CategoryRepository  # noqa: E402
+from repository.transaction_repository import TransactionRepository  # noqa: E402
+from storage.json_storage import JsonStorage  # noqa: E402
+
+
+@pytest.fixture
+def storage() -> JsonStorage:
+    return JsonStorage(AppLogger("expense-tracker-test"), fsync_on_write=False)
+
+
+@pytest.fixture
+def transaction_repo(storage: JsonStorage) -> TransactionRepository:
+    return TransactionRepository(storage, AppLogger("expense-tracker-test"))
+
+
+@pytest.fixture
+def category_repo(storage: JsonStorage) -> CategoryRepository:
+    return CategoryRepository(storage, AppLogger("expense-tracker-test"))
+
+
+@pytest.fixture
+def transaction_service(transaction_repo: TransactionRepository) -> TransactionService:
+    return TransactionService(transaction_repo, AppLogger("expense-tracker-test"))
+
+
+@pytest.fixture
+def category_service(category_repo: CategoryRepository) -> CategoryService:
+    return CategoryService(category_repo, AppLogger("expense-tracker-test"))
+
+
+@pytest.fixture
+def controller(transaction_service: TransactionService, category_service: CategoryService) -> CommandController:
+    return CommandController(transaction_service, category_service, AppLogger("expense-tracker-test"))
+
+
+def _write(data_dir: Path, name: str, data) -> None:
+    (data_dir / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_locate_finds_first_matching_record(tmp_path: Path, transaction_repo) -> None:
+    _write(tmp_path, "transactions.json", [{"id": "1"}, {"id": "2"}, {"id": "2", "dup": True}])
+
+    records, pos = transaction_repo.locate(str(tmp_path), "2")
+
+    assert pos == 1
+    assert records[pos] == {"id": "2"}
+
+
+def test_locate_missing_id_or_file_returns_none(tmp_path: Path, transaction_repo, category_repo) -> None:
+    assert category_repo.locate(str(tmp_path), "1") == ([], None)
+
+    _write(tmp_path, "transactions.json", [{"id": "1"}])
+    assert transaction_repo.locate(str(tmp_path), "9") == ([{"id": "1"}], None)
+
+
+def test_locate_accepts_unhashable_ids(tmp_path: Path, category_repo) -> None:
+    _write(tmp_path, "categories.json", [{"id": ["a", "b"]}, {"id": {"k": 1}}])
+
+    _, pos = category_repo.locate(str(tmp_path), {"k": 1})
+    assert pos == 1
+    _, pos = category_repo.locate(str(tmp_path), ["a"])
+    assert pos is None
+
+
+def test_locate_skips_non_dict_items(tmp_path: Path, transaction_repo, category_repo) -> None:
+    _write(tmp_path, "transactions.json", ["junk", 3, {"id": "1"}])
+    _write(tmp_path, "categories.json", ["junk", None, {"id": "c1"}])
+
+    records, pos = transaction_repo.locate(str(tmp_path), "1")
+    assert pos == 2
+    assert records[0] == {"_raw": "junk"}
+
+    records, pos = category_repo.locate(str(tmp_path), "c1")
+    assert pos == 2
+    assert records[:2] == ["junk", None]
+
+
+def test_mutating_a_result_does_not_leak_into_later_reads(
+    tmp_path: Path, transaction_service, category_service
+) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1", "amount": 5}, data_dir)
+    category_service.create({"id": "c1", "name": "food"}, data_dir)
+
+    transaction_service.get("1", data_dir)["amount"] = 99
+    transaction_service.list({}, data_dir).clear()
+    category_service.get("c1", data_dir)["name"] = "changed"
+
+    assert transaction_service.get("1", data_dir) == {"id": "1", "amount": 5}
+    assert transaction_service.list({}, data_dir) == [{"id": "1", "amount": 5}]
+    assert category_service.get("c1", data_dir) == {"id": "c1", "name": "food"}
+
+
+def test_update_persists_after_caller_mutated_a_read(tmp_path: Path, transaction_service, category_service) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1", "amount": 5}, data_dir)
+    category_service.create({"id": "c1", "name": "food"}, data_dir)
+
+    # Mutating a previous result must not make the update look like a no-op.
+    transaction_service.get("1", data_dir)["amount"] = 99
+    category_service.get("c1", data_dir)["name"] = "groceries"
+    transaction_service.update("1", {"amount": 99}, data_dir)
+    category_service.update("c1", {"name": "groceries"}, data_dir)
+
+    assert json.loads((tmp_path / "transactions.json").read_text(encoding="utf-8")) == [{"id": "1", "amount": 99}]
+    assert json.loads((tmp_path / "categories.json").read_text(encoding="utf-8")) == [{"id": "c1", "name": "groceries"}]
+
+
+def test_noop_update_does_not_rewrite_file(tmp_path: Path, transaction_service) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1", "amount": 5}, data_dir)
+    path = tmp_path / "transactions.json"
+    path.write_text('[{"id": "1", "amount": 5}]', encoding="utf-8")  # distinct formatting marks the original
+
+    assert transaction_service.update("1", {"amount": 5, "id": "x"}, data_dir) == {"id": "1", "amount": 5}
+    assert path.read_text(encoding="utf-8") == '[{"id": "1", "amount": 5}]'
+
+
+def test_write_keeps_non_finite_floats(tmp_path: Path, storage: JsonStorage) -> None:
+    path = str(tmp_path / "data.json")
+    storage.write(path, [{"id": "1", "amount": float("nan"), "limit": float("inf"), "note": None}])
+
+    loaded = storage.read(path)
+
+    assert loaded[0]["amount"] != loaded[0]["amount"]  # NaN
+    assert loaded[0]["limit"] == float("inf")
+    assert loaded[0]["note"] is None
+
+
+
+@pytest.mark.parametrize("value", [date(2024, 1, 1), uuid.UUID(int=0)])
+def test_write_rejects_values_stdlib_json_cannot_encode(tmp_path: Path, storage: JsonStorage, value) -> None:
+    path = tmp_path / "data.json"
+
+    with pytest.raises(TypeError):
+        storage.write(str(path), [{"id": "1", "when": value}])
+    assert not path.exists()
+
+def test_create_many_writes_all_records_once(tmp_path: Path, transaction_service) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1"}, data_dir)
+
+    result = transaction_service.create_many([{"id": "2"}, {"id": "3"}], data_dir)
+
+    assert result == {"created": [{"id": "2"}, {"id": "3"}]}
+    assert transaction_service.list({}, data_dir) == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+
+
+@pytest.mark.parametrize(
+    "records, error",
+    [
+        ([{"id": "2"}, {"amount": 1}], "validation"),
+        ([{"id": "2"}, {"id": ["x"]}], "validation"),
+        ([{"id": "2"}, {"id": "2"}], "conflict"),
+        ([{"id": "2"}, {"id": "1"}], "conflict"),
+    ],
+)
+def test_create_many_validates_whole_batch_before_writing(
+    tmp_path: Path, transaction_service, records, error
+) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1"}, data_dir)
+    before = (tmp_path / "transactions.json").read_bytes()
+
+    assert transaction_service.create_many(records, data_dir)["error"] == error
+    assert (tmp_path / "transactions.json").read_bytes() == before
+
+
+def test_controller_batch_create_transactions(tmp_path: Path, controller) -> None:
+    command = {"entity": "transaction", "action": "create", "params": {"records": [{"id": "1"}, {"id": "2"}]}}
+
+    assert controller.handle(command, str(tmp_path)) == {"created": [{"id": "1"}, {"id": "2"}]}
+    assert controller.handle({"entity": "transaction", "action": "list"}, str(tmp_path)) == {
+        "result": [{"id": "1"}, {"id": "2"}]
+    }
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        {"entity": "transaction", "action": "create", "params": {"records": {"id": "1"}}},
+        {"entity": "category", "action": "create", "params": {"records": [{"id": "c1"}]}},
+    ],
+)
+def test_controller_rejects_invalid_batch_create(tmp_path: Path, controller, command) -> None:
+    assert controller.handle(command, str(tmp_path))["error"] == "validation_error"
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("fields", [{"amount": 5.0}, {"flag": True}, {"tags": [1.0]}])
+def test_update_saves_when_only_the_json_type_changes(tmp_path: Path, transaction_service, fields) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": "1", "amount": 5, "flag": 1, "tags": [1]}, data_dir)
+
+    transaction_service.update("1", fields, data_dir)
+
+    stored = json.loads((tmp_path / "transactions.json").read_text(encoding="utf-8"))[0]
+    for key, value in fields.items():
+        assert stored[key] == value and type(stored[key]) is type(value)
+        if key == "tags":
+            assert type(stored[key][0]) is float
+
+
+def test_create_many_accepts_stored_unhashable_id(tmp_path: Path, transaction_service) -> None:
+    data_dir = str(tmp_path)
+    transaction_service.create({"id": ["x"]}, data_dir)
+
+    assert transaction_service.create_many([{"id": "2"}], data_dir) == {"created": [{"id": "2"}]}
+    assert transaction_service.list({}, data_dir) == [{"id": ["x"]}, {"id": "2"}]
+
+
+def test_create_many_does_not_match_wrapped_items_as_id_none(tmp_path: Path, transaction_service) -> None:
+    _write(tmp_path, "transactions.json", ["junk"])
+
+    # The wrapper has no id, so there is no conflict; save_all then rejects the unsaveable file.
+    with pytest.raises(ValueError, match="missing required 'id'"):
+        transaction_service.create_many([{"id": None}], str(tmp_path))
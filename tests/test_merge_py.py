@@ -0,0 +1,70 @@
+# tests/test_merge_py.py
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# helper/ is a script directory, not a package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "helper"))
+
+import merge_py  # noqa: E402
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "__pycache__").mkdir()
+    (src / ".venv" / "lib").mkdir(parents=True)
+
+    (src / "a.py").write_bytes(b"a = 1\r\nb = 2\r\n")
+    (src / "pkg" / "b.py").write_bytes(b"x = '\xe9'\n")  # latin-1, not valid UTF-8
+    (src / "notes.txt").write_bytes(b"ignored\n")
+    (src / "__pycache__" / "c.py").write_bytes(b"skipped\n")
+    (src / ".venv" / "lib" / "d.py").write_bytes(b"skipped\n")
+    return src
+
+
+def _symlinks_supported(tmp_path: Path) -> bool:
+    try:
+        os.symlink(tmp_path / "missing", tmp_path / "probe")
+    except (OSError, NotImplementedError):
+        return False
+    os.remove(tmp_path / "probe")
+    return True
+
+
+def test_collect_skips_dirs_and_filters_names(tree: Path) -> None:
+    files = merge_py.collect_all_files([str(tree)], [], merge_py.OUTPUT_NAME)
+
+    assert files == [str(tree / "a.py"), str(tree / "pkg" / "b.py")]
+
+
+def test_collect_symlinks(tmp_path: Path, tree: Path) -> None:
+    if not _symlinks_supported(tmp_path):
+        pytest.skip("symlinks not supported")
+    os.symlink(os.path.join("pkg", "b.py"), tree / "link.py")
+    os.symlink("nowhere.py", tree / "broken.py")
+    os.symlink("pkg", tree / "pkg_link.py")  # symlinked directory: never followed
+
+    files = merge_py.collect_all_files([str(tree)], [str(tree / "link.py")], merge_py.OUTPUT_NAME)
+
+    # The alias resolves to pkg/b.py, which wins over the symlink; the broken link stays listed.
+    assert files == [str(tree / "a.py"), str(tree / "broken.py"), str(tree / "pkg" / "b.py")]
+
+
+def test_merge_copies_bodies_verbatim(tmp_path: Path, tree: Path) -> None:
+    out = tmp_path / merge_py.OUTPUT_NAME
+    files = [str(tree / "a.py"), str(tree / "pkg" / "b.py"), str(tree / "missing.py")]
+
+    merge_py.merge_all(files, str(out))
+
+    rule = b"#" * 90
+    data = out.read_bytes()
+    assert data.startswith(b"\n" + rule + b"\n# FILE: " + os.path.join("src", "a.py").encode() + b"\n" + rule + b"\n\n")
+    assert b"a = 1\r\nb = 2\r\n\n\n" in data
+    assert b"x = '\xe9'\n\n\n" in data
+    assert b"!! ERROR READING FILE:" in data
@@ -0,0 +1,35 @@
+# tests/test_openaicost.py
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# helper/ is a script directory, not a package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "helper"))
+
+import openaicost  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b'{"created":1,"usage":{"total_tokens":7,"prompt_tokens":3,"completion_tokens":4}}', (7, 3, 4, 1)),
+        # Usage-like keys outside the top-level "usage" object are not counted.
+        (
+            b'{"created":1,"choices":[{"message":{"tool_result":'
+            b'{"total_tokens":7,"prompt_tokens":3,"completion_tokens":4}}}]}',
+            (0, 0, 0, 1),
+        ),
+        (b'{"usage":null}', (0, 0, 0, None)),
+        # Malformed documents are skipped.
+        (b'{"created":1, GARBAGE, "usage":{"total_tokens":7}}', None),
+        (b'{"created":01,"usage":{"total_tokens":7}}', None),
+    ],
+)
+def test_process_file(tmp_path: Path, raw: bytes, expected) -> None:
+    path = tmp_path / "x_response.json"
+    path.write_bytes(raw)
+
+    assert openaicost._process_file(str(path)) == expected